@@ -62,19 +62,24 @@ new_task_id = qrmi.task_start(
 )
 print("New Task ID: %s" % new_task_id)
 
-# Wait for completion
+# Wait for completion, reporting only status changes. Polling starts fast and
+# backs off exponentially, so short tasks are not held up by a fixed interval.
+last_status = None
+delay = 0.05
 while True:
     status = qrmi.task_status(new_task_id)
     if status == TaskStatus.Completed:
         print("Task completed")
-        time.sleep(0.5)
         break
     elif status == TaskStatus.Failed:
         print("Task failed")
         break
     else:
-        print("Task status %s, waiting 1s" % status)
-        time.sleep(1)
+        if status != last_status:
+            print("Task status %s" % status)
+            last_status = status
+        time.sleep(delay)
+        delay = min(delay * 2, 2.0)
 
 # Get the results
 print("Results: %s" % qrmi.task_result(new_task_id).value)
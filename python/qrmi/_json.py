@@ -0,0 +1,77 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright 2026 IBM. All Rights Reserved.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""JSON helpers shared by QRMI python modules"""
+
+import json
+import math
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def loads(data: str | bytes) -> Any:
+    """Deserialize a JSON document.
+
+    orjson is used when it is installed, otherwise the standard library
+    json module. Both raise ``json.JSONDecodeError`` on malformed input.
+
+    Args:
+        data: JSON document.
+
+    Returns:
+        Deserialized python object.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _has_non_finite(obj: Any) -> bool:
+    """Returns whether a float in ``obj`` is NaN or infinite"""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(k) or _has_non_finite(v) for k, v in obj.items())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(item) for item in obj)
+    return False
+
+
+def dumps(obj: Any) -> str:
+    """Serialize an object to a compact JSON document.
+
+    orjson is used when it is installed, with non-string dictionary keys
+    converted to strings. orjson writes NaN and infinity as ``null``, so
+    documents holding such floats, and objects orjson cannot serialize, are
+    passed to the json module, which writes ``NaN`` and ``Infinity``. Both
+    paths omit whitespace between separators.
+
+    Args:
+        obj: Object to serialize.
+
+    Returns:
+        JSON document.
+    """
+    if orjson is not None:
+        try:
+            data = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+        else:
+            # Scanning is only needed when orjson wrote a null.
+            if b"null" not in data or not _has_non_finite(obj):
+                return data.decode()
+    return json.dumps(obj, separators=(",", ":"))
@@ -14,15 +14,15 @@
 
 """Estimator V2 base class for IBM QRMI"""
 
-import json
 from dataclasses import dataclass, field
 from collections.abc import Iterable
-from qiskit import qasm3
 from qiskit.primitives.base import BaseEstimatorV2
 from qiskit.primitives.containers.estimator_pub import EstimatorPub, EstimatorPubLike
 
 from qrmi import QuantumResource, Payload
+from qrmi import _json
 
+from .qasm import dumps_qasm3
 from .runtime_job_v2 import RuntimeJobV2
 
 
@@ -52,21 +52,21 @@ class QRMIBaseEstimatorV2(BaseEstimatorV2):
         self._options = Options(**options) if options else Options()
 
     def run(self, pubs: Iterable[EstimatorPubLike], *, precision: float | None = None):
+        """Submits pubs to QRMI as a single estimator task.
+
+        A circuit object shared by several pubs is serialized once per call.
+        """
         if precision is None:
             precision = self._options.default_precision
 
         # for each Pub (Primitive Unified Bloc)
         dict_pubs = []
+        qasm3_memo = {}
         for pub in pubs:
             # Coerce a EstimatorPubLike object into a EstimatorPub instance.
             coerced_pub = EstimatorPub.coerce(pub, precision)
             # Generate OpenQASM3 string which can be consumed by IBM Quantum APIs
-            qasm3_str = qasm3.dumps(
-                coerced_pub.circuit,
-                disable_constants=True,
-                allow_aliasing=True,
-                experimental=qasm3.ExperimentalFeatures.SWITCH_CASE_V1,
-            )
+            qasm3_str = dumps_qasm3(coerced_pub.circuit, qasm3_memo)
 
             observables = coerced_pub.observables.tolist()
             param_array = coerced_pub.parameter_values.as_array(
@@ -101,7 +101,7 @@ class QRMIBaseEstimatorV2(BaseEstimatorV2):
             input_json["precision"] = precision
 
         payload = Payload.QiskitPrimitive(
-            input=json.dumps(input_json), program_id="estimator"
+            input=_json.dumps(input_json), program_id="estimator"
         )
         job_id = self._qrmi.task_start(payload)
         return RuntimeJobV2(self._qrmi, job_id, delete_job=True)
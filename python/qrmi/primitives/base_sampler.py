@@ -12,15 +12,15 @@
 
 """Sampler V2 base class for IBM QRMI"""
 
-import json
 from dataclasses import dataclass, field
 from collections.abc import Iterable
-from qiskit import qasm3
 from qiskit.primitives.base import BaseSamplerV2
 from qiskit.primitives.containers.sampler_pub import SamplerPub, SamplerPubLike
 
 from qrmi import QuantumResource, Payload
+from qrmi import _json
 
+from .qasm import dumps_qasm3
 from .runtime_job_v2 import RuntimeJobV2
 
 
@@ -51,22 +51,21 @@ class QRMIBaseSamplerV2(BaseSamplerV2):
         self._options = Options(**options) if options else Options()
 
     def run(self, pubs: Iterable[SamplerPubLike], *, shots: int | None = None):
+        """Submits pubs to QRMI as a single sampler task.
 
+        A circuit object shared by several pubs is serialized once per call.
+        """
         if shots is None:
             shots = self._options.default_shots
 
         # for each Pub (Primitive Unified Bloc)
         dict_pubs = []
+        qasm3_memo = {}
         for pub in pubs:
             # Coerce a SamplerPubLike object into a SamplerPub instance.
             coerced_pub = SamplerPub.coerce(pub, shots)
             # Generate OpenQASM3 string which can be consumed by IBM Quantum APIs
-            qasm3_str = qasm3.dumps(
-                coerced_pub.circuit,
-                disable_constants=True,
-                allow_aliasing=True,
-                experimental=qasm3.ExperimentalFeatures.SWITCH_CASE_V1,
-            )
+            qasm3_str = dumps_qasm3(coerced_pub.circuit, qasm3_memo)
 
             if len(coerced_pub.circuit.parameters) == 0:
                 if coerced_pub.shots:
@@ -94,7 +93,7 @@ class QRMIBaseSamplerV2(BaseSamplerV2):
         }
 
         payload = Payload.QiskitPrimitive(
-            input=json.dumps(input_json), program_id="sampler"
+            input=_json.dumps(input_json), program_id="sampler"
         )
         job_id = self._qrmi.task_start(payload)
         return RuntimeJobV2(self._qrmi, job_id, delete_job=True)
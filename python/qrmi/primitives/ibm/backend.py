@@ -12,9 +12,9 @@
 
 """IBMBackend implementation with IBM QRMI"""
 
-import json
+import hashlib
+from collections import OrderedDict
 from typing import Any, List, Optional
-import dateutil
 
 from qiskit import QuantumCircuit
 from qiskit.providers.backend import Backend, BackendV2
@@ -33,6 +33,12 @@ from qiskit_ibm_runtime.models import (
     BackendStatus,
 )
 from qrmi import QuantumResource  # pylint: disable=no-name-in-module
+from qrmi import _json
+
+
+def _payload_digest(payload: str) -> bytes:
+    """Returns a digest identifying the content of a QRMI target payload"""
+    return hashlib.blake2b(payload.encode(), digest_size=16).digest()
 
 
 def get_backend(
@@ -40,6 +46,10 @@ def get_backend(
 ) -> Backend:
     """Returns Qiskit transpiler target
 
+    A new backend is returned on every call, but the configuration,
+    properties and Target conversions are shared with earlier backends built
+    from an identical target payload, so they are not repeated.
+
     Args:
         qrmi: IBM QRMI object
         use_fractional_gates: Whether to use native “fractional gates” on the device if available.
@@ -54,37 +64,51 @@ def get_backend(
 
 
 class QRMIBackend(BackendV2):
-    """Backend class interfacing with an IBM Quantum backend."""
+    """Backend class interfacing with an IBM Quantum backend.
+
+    Backends built from an identical QRMI target payload and
+    ``use_fractional_gates`` option share their configuration, properties and
+    :class:`~qiskit.transpiler.Target` objects. These are meant to be
+    read-only; modifying them in place affects all such backends.
+    """
+
+    _TARGET_CACHE_SIZE = 8
+    # (payload digest, use_fractional_gates) -> (configuration, properties, target)
+    _TARGET_CACHE: "OrderedDict[tuple, tuple]" = OrderedDict()
 
     def __init__(
         self,
         qrmi: QuantumResource,
         **fields,
     ):
+        """QRMIBackend constructor.
+
+        Args:
+            qrmi: IBM QRMI object.
+            **fields: Backend options.
+        """
         self._qrmi = qrmi
-        target = self._qrmi.target()
-        target = json.loads(target.value)
-        config_dict = target["configuration"]
-        prop_dict = target["properties"]
+        self._configuration_attrs: set[str] = set()
+        use_fractional_gates = fields.get(
+            "use_fractional_gates", self._default_options().use_fractional_gates
+        )
+        configuration, properties, target = self._convert_payload(
+            self._qrmi.target().value, use_fractional_gates
+        )
 
         super().__init__(
-            name=config_dict["backend_name"],
-            online_date=dateutil.parser.isoparse(config_dict["online_date"]),
-            backend_version=config_dict["backend_version"],
+            name=configuration.backend_name,
+            online_date=configuration.online_date,
+            backend_version=configuration.backend_version,
         )
         if fields:
             self.set_options(**fields)
 
-        self._configuration = configuration_from_server_data(
-            config_dict, use_fractional_gates=self.options.use_fractional_gates
-        )
-        self._properties = properties_from_server_data(
-            prop_dict, use_fractional_gates=self.options.use_fractional_gates
-        )
-        self._target = convert_to_target(
-            configuration=self._configuration,  # type: ignore[arg-type]
-            properties=self._properties,
-        )
+        self._configuration = configuration
+        self._properties = properties
+        self._target = target
+        self._use_fractional_gates = use_fractional_gates
+        self._faulty_qubits, self._faulty_edges = self._faulty_components(properties)
 
     def __getattr__(self, name: str) -> Any:
         """Gets attribute from self or configuration
@@ -93,7 +117,12 @@ class QRMIBackend(BackendV2):
         does not yet exist on QRMIBackend class.
         """
         # Prevent recursion since these properties are accessed within __getattr__
-        if name in ["_properties", "_target", "_configuration"]:
+        if name in [
+            "_properties",
+            "_target",
+            "_configuration",
+            "_configuration_attrs",
+        ]:
             raise AttributeError(
                 f"'{self.__class__.__name__}' object has no attribute '{name}'"
             )
@@ -106,11 +135,17 @@ class QRMIBackend(BackendV2):
         # If attribute is still not available on QRMIBackend class,
         # fallback to check if the attribute is available in configuration
         try:
-            return self._configuration.__getattribute__(name)
+            value = self._configuration.__getattribute__(name)
         except AttributeError as ex:
             raise AttributeError(
                 f"'{self.__class__.__name__}' object has no attribute '{name}'"
             ) from ex
+        # Store the resolved value on the instance so that subsequent accesses
+        # are plain attribute lookups. These are dropped in _load_target()
+        # whenever the configuration is replaced.
+        self.__dict__[name] = value
+        self._configuration_attrs.add(name)
+        return value
 
     @classmethod
     def _default_options(cls) -> Options:
@@ -135,20 +170,101 @@ class QRMIBackend(BackendV2):
     def _convert_to_target(self, refresh: bool = False) -> None:
         """Converts backend configuration and properties to Target object"""
         if refresh or not self._target:
-            target = self._qrmi.target()
-            target = json.loads(target.value)
-            self._configuration = configuration_from_server_data(
-                target["configuration"],
-                use_fractional_gates=self.options.use_fractional_gates,
-            )
-            self._properties = properties_from_server_data(
-                target["properties"],
-                use_fractional_gates=self.options.use_fractional_gates,
-            )
-            self._target = convert_to_target(
-                configuration=self._configuration,  # type: ignore[arg-type]
-                prperties=self._properties,
+            self._load_target(self._qrmi.target().value)
+
+    @classmethod
+    def _convert_payload(
+        cls, payload: str, use_fractional_gates: Optional[bool]
+    ) -> tuple[QasmBackendConfiguration, Optional[BackendProperties], Target]:
+        """Returns configuration, properties and Target for a QRMI target payload
+
+        The conversions are memoized on the class by payload content in a
+        least recently used cache, so the payload is only decoded and
+        converted the first time it is seen.
+
+        Args:
+            payload: JSON target payload.
+            use_fractional_gates: Whether to use fractional gates.
+
+        Returns:
+            Backend configuration, properties and Target.
+
+        Raises:
+            IBMBackendError: If the payload has an invalid backend configuration.
+        """
+        key = (_payload_digest(payload), use_fractional_gates)
+        try:
+            # Another thread may evict the entry between the lookup and the
+            # reordering, so both are covered by the same handler.
+            cached = cls._TARGET_CACHE[key]
+            cls._TARGET_CACHE.move_to_end(key)
+            return cached
+        except KeyError:
+            pass
+
+        target = _json.loads(payload)
+        configuration = configuration_from_server_data(
+            target["configuration"],
+            use_fractional_gates=use_fractional_gates,
+        )
+        if configuration is None:
+            raise IBMBackendError(
+                "QRMI target payload contains an invalid backend configuration."
             )
+        properties = properties_from_server_data(
+            target["properties"],
+            use_fractional_gates=use_fractional_gates,
+        )
+        cached = (
+            configuration,
+            properties,
+            convert_to_target(
+                configuration=configuration,  # type: ignore[arg-type]
+                properties=properties,
+            ),
+        )
+        cls._TARGET_CACHE[key] = cached
+        if len(cls._TARGET_CACHE) > cls._TARGET_CACHE_SIZE:
+            try:
+                cls._TARGET_CACHE.popitem(last=False)
+            except KeyError:
+                # Emptied by a concurrent eviction
+                pass
+        return cached
+
+    def _load_target(self, payload: str) -> None:
+        """Sets configuration, properties and Target from a QRMI target payload
+
+        Args:
+            payload: JSON target payload.
+        """
+        use_fractional_gates = self.options.use_fractional_gates
+        configuration, properties, target = self._convert_payload(
+            payload, use_fractional_gates
+        )
+        for name in self._configuration_attrs:
+            self.__dict__.pop(name, None)
+        self._configuration_attrs.clear()
+        self._configuration = configuration
+        self._properties = properties
+        self._target = target
+        self._use_fractional_gates = use_fractional_gates
+        self._faulty_qubits, self._faulty_edges = self._faulty_components(properties)
+
+    @staticmethod
+    def _faulty_components(
+        properties: Optional[BackendProperties],
+    ) -> tuple[frozenset[int], frozenset[frozenset[int]]]:
+        """Returns faulty qubits and edges of backend properties"""
+        if properties is None:
+            return frozenset(), frozenset()
+        # Edges are unordered so that a faulty (a, b) gate also flags (b, a)
+        faulty_edges = frozenset(
+            frozenset(gate.qubits)
+            for gate in properties.faulty_gates()
+            if len(gate.qubits) > 1
+        )
+        return frozenset(properties.faulty_qubits()), faulty_edges
 
     @property
     def dtm(self) -> float:
@@ -247,10 +363,13 @@ class QRMIBackend(BackendV2):
         """
         if refresh or self._properties is None:
             target = self._qrmi.target()
-            target = json.loads(target.value)
+            target = _json.loads(target.value)
             self._properties = properties_from_server_data(
                 target["properties"],
-                use_fractional_gates=self.options.use_fractional_gates,
+                use_fractional_gates=self._use_fractional_gates,
+            )
+            self._faulty_qubits, self._faulty_edges = self._faulty_components(
+                self._properties
             )
 
         return self._properties
@@ -267,16 +386,19 @@ class QRMIBackend(BackendV2):
         if not self.properties():
             return
 
-        faulty_qubits = self.properties().faulty_qubits()
-        faulty_gates = self.properties().faulty_gates()
-        faulty_edges = [
-            tuple(gate.qubits) for gate in faulty_gates if len(gate.qubits) > 1
-        ]
+        faulty_qubits = self._faulty_qubits
+        faulty_edges = self._faulty_edges
+        if not faulty_qubits and not faulty_edges:
+            return
+
+        # Resolve qubit indices once per circuit instead of calling
+        # circuit.find_bit() for every qubit of every instruction.
+        qubit_index = {qubit: index for index, qubit in enumerate(circuit.qubits)}
 
         for instr in circuit.data:
             if instr.operation.name == "barrier":
                 continue
-            qubit_indices = tuple(circuit.find_bit(x).index for x in instr.qubits)
+            qubit_indices = tuple(qubit_index[x] for x in instr.qubits)
 
             for circ_qubit in qubit_indices:
                 if circ_qubit in faulty_qubits:
@@ -285,7 +407,7 @@ class QRMIBackend(BackendV2):
                         f"{instr} operating on a faulty qubit {circ_qubit}."
                     )
 
-            if len(qubit_indices) == 2 and qubit_indices in faulty_edges:
+            if len(qubit_indices) == 2 and frozenset(qubit_indices) in faulty_edges:
                 raise ValueError(
                     f"Circuit {circuit.name} contains instruction "
                     f"{instr} operating on a faulty edge {qubit_indices}"
@@ -305,7 +427,7 @@ class QRMIBackend(BackendV2):
 
     def get_translation_stage_plugin(self) -> str:
         """Return the default translation stage plugin name for IBM backends."""
-        if not self.options.use_fractional_gates:
+        if not self._use_fractional_gates:
             return "ibm_dynamic_circuits"
         return "ibm_dynamic_and_fractional"
 
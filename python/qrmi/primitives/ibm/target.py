@@ -2,7 +2,7 @@
 
 # This code is part of Qiskit.
 #
-# (C) Copyright 2024, 2025 IBM. All Rights Reserved.
+# (C) Copyright 2024, 2026 IBM. All Rights Reserved.
 #
 # This code is licensed under the Apache License, Version 2.0. You may
 # obtain a copy of this license in the LICENSE.txt file in the root directory
@@ -15,11 +15,11 @@
 """Qiskit Target creation"""
 
 # pylint: disable=invalid-name
-import json
 from qiskit.transpiler.target import Target
 from qiskit_ibm_runtime.utils.backend_converter import convert_to_target
 from qiskit_ibm_runtime.models import BackendProperties, BackendConfiguration
 from qrmi import QuantumResource
+from qrmi import _json
 
 
 def get_target(qrmi: QuantumResource) -> Target:
@@ -32,7 +32,7 @@ def get_target(qrmi: QuantumResource) -> Target:
         qiskit.transpiler.target.Target: Qiskit Transpiler target
     """
     target = qrmi.target()
-    target = json.loads(target.value)
+    target = _json.loads(target.value)
     backend_config = BackendConfiguration.from_dict(target["configuration"])
     backend_props = BackendProperties.from_dict(target["properties"])
     return convert_to_target(backend_config, backend_props)
@@ -1,6 +1,6 @@
 # This code is part of Qiskit.
 #
-# (C) Copyright 2025 Pasqal, IBM. All Rights Reserved.
+# (C) Copyright 2025, 2026 Pasqal, IBM. All Rights Reserved.
 #
 # This code is licensed under the Apache License, Version 2.0. You may
 # obtain a copy of this license in the LICENSE.txt file in the root directory
@@ -12,7 +12,6 @@
 
 """Sampler V2 base class for Pasqal QRMI resources."""
 
-import json
 import time
 from dataclasses import dataclass, field
 from typing import Any
@@ -33,6 +32,7 @@ from qiskit_pasqal_provider.providers.pulse_utils import (
 )
 
 from qrmi import Payload, QuantumResource, TaskStatus
+from qrmi import _json
 
 from .target import get_device
 
@@ -48,7 +48,7 @@ STATUS_MAP = {
 def _normalize_pasqal_payload(payload: Any) -> dict[str, Any]:
     """Return payload as a dictionary from JSON text or dict."""
     if isinstance(payload, str):
-        parsed_payload = json.loads(payload)
+        parsed_payload = _json.loads(payload)
     elif isinstance(payload, dict):
         parsed_payload = payload
     else:
@@ -65,11 +65,21 @@ def _extract_counts(payload: dict[str, Any]) -> dict[str, int]:
     counter_payload = payload.get("counter")
     if not isinstance(counter_payload, dict):
         raise RuntimeError(f"Unsupported counter payload: {counter_payload!r}.")
-    counts = {
-        str(bitstring): int(count)
+    # A decoded JSON histogram is usually already well formed, in which case
+    # it is returned as-is rather than copied into a second dictionary.
+    if all(
+        isinstance(bitstring, str)
+        and isinstance(count, int)
+        and not isinstance(count, bool)
         for bitstring, count in counter_payload.items()
-        if isinstance(count, (int, float))
-    }
+    ):
+        counts = counter_payload
+    else:
+        counts = {
+            str(bitstring): int(count)
+            for bitstring, count in counter_payload.items()
+            if isinstance(count, (int, float))
+        }
     if not counts:
         raise RuntimeError(f"No valid counts found in payload: {payload!r}.")
     return counts
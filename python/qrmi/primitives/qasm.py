@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright 2026 IBM. All Rights Reserved.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""OpenQASM3 serialization for IBM QRMI primitives"""
+
+from typing import Optional
+
+from qiskit import QuantumCircuit, qasm3
+
+
+def dumps_qasm3(circuit: QuantumCircuit, memo: Optional[dict] = None) -> str:
+    """Returns OpenQASM3 string which can be consumed by IBM Quantum APIs
+
+    Args:
+        circuit: Circuit to serialize.
+        memo: Dictionary kept by the caller for the duration of a single
+            submission. Circuit objects already serialized into it are
+            not exported again.
+
+    Returns:
+        OpenQASM3 representation of ``circuit``.
+    """
+    if memo is not None:
+        # The circuit is stored with its string so that its id cannot be
+        # reused by another object while the memo is alive.
+        entry = memo.get(id(circuit))
+        if entry is None:
+            entry = memo[id(circuit)] = (circuit, dumps_qasm3(circuit))
+        return entry[1]
+
+    return qasm3.dumps(
+        circuit,
+        disable_constants=True,
+        allow_aliasing=True,
+        experimental=qasm3.ExperimentalFeatures.SWITCH_CASE_V1,
+    )
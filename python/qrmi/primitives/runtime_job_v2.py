@@ -35,6 +35,11 @@ STATUS_MAP = {
     TaskStatus.Cancelled: JobStatus.CANCELLED,
 }
 
+# Status polling starts fast so short jobs return promptly, then backs off
+# exponentially to avoid flooding the QRMI backend while long jobs run.
+POLL_INTERVAL_MIN_SECONDS = 0.05
+POLL_INTERVAL_MAX_SECONDS = 2.0
+
 
 class RuntimeJobV2(BasePrimitiveJob[PrimitiveResult, TaskStatus]):
     """Representation of a runtime V2 primitive exeuction."""
@@ -69,11 +74,13 @@ class RuntimeJobV2(BasePrimitiveJob[PrimitiveResult, TaskStatus]):
         if self._last_status is not None and self._result is not None:
             return self._result
 
+        delay = POLL_INTERVAL_MIN_SECONDS
         while True:
             if self.in_final_state() is True:
                 break
 
-            time.sleep(1)
+            time.sleep(delay)
+            delay = min(delay * 2, POLL_INTERVAL_MAX_SECONDS)
 
         result = self._qrmi.task_result(self._job_id)
         self._result = ResultDecoder.decode(result.value)
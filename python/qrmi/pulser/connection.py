@@ -35,6 +35,7 @@ from pulser.backend.results import Results
 from pulser.result import SampledResult
 
 from qrmi import Payload, QuantumResource, TaskStatus, ResourceType  # type: ignore
+from qrmi import _json
 from qrmi.pulser.service import QRMIService
 
 logger = logging.getLogger(__name__)
@@ -47,7 +48,10 @@ _QRMI_TASK_STATUS_MAP: dict[TaskStatus, JobStatus] = {
     TaskStatus.Cancelled: JobStatus.CANCELED,
 }
 
-JOB_EXECUTION_POLLING_INTERVAL_S = 1
+# Status polling starts fast so short jobs return promptly, then backs off
+# exponentially to avoid flooding the QRMI backend while long jobs run.
+JOB_EXECUTION_POLLING_INTERVAL_MIN_S = 0.05
+JOB_EXECUTION_POLLING_INTERVAL_MAX_S = 2.0
 
 _COMPATIBLE_RESOURCE_TYPES: tuple[ResourceType] = (
     ResourceType.PasqalLocal,
@@ -58,7 +62,7 @@ _COMPATIBLE_RESOURCE_TYPES: tuple[ResourceType] = (
 def _normalize_json_payload(payload: Any) -> dict[str, Any]:
     """Return payload as a dictionary from JSON text or dict."""
     if isinstance(payload, str):
-        normalized = json.loads(payload)
+        normalized = _json.loads(payload)
     else:
         raise TypeError("Unsupported payload type. Expected JSON string or dict.")
 
@@ -292,6 +296,10 @@ class PulserQRMIConnection(RemoteConnection):
         batch_id = self._batch_id_from_job_ids(new_job_ids)
         self._current_batch_id = batch_id
 
+        # All tasks are started above before waiting on any of them, so
+        # waiting for them in turn adds no latency beyond the completion of the
+        # last task. Submitting from a thread pool would not help:
+        # QuantumResource methods hold the GIL and take &mut self.
         if wait:
             for job_id in new_job_ids:
                 self._wait_job_execution(job_id)
@@ -305,6 +313,7 @@ class PulserQRMIConnection(RemoteConnection):
 
     def _wait_job_execution(self, job_id: str):
         """Waits until job execution is complete"""
+        delay = JOB_EXECUTION_POLLING_INTERVAL_MIN_S
         while True:
             status = self._qrmi.task_status(job_id)
             if status in (
@@ -313,7 +322,8 @@ class PulserQRMIConnection(RemoteConnection):
                 TaskStatus.Cancelled,
             ):
                 return
-            time.sleep(JOB_EXECUTION_POLLING_INTERVAL_S)
+            time.sleep(delay)
+            delay = min(delay * 2, JOB_EXECUTION_POLLING_INTERVAL_MAX_S)
 
     def _get_job_ids(self, batch_id: str) -> list[str]:
         """Retrieve the list of Job IDs from the Batch ID"""
@@ -0,0 +1,249 @@
+"""Tests for QRMI IBM backend."""
+
+import json
+import os
+from collections import OrderedDict
+
+import pytest
+from qiskit.circuit import QuantumCircuit
+from qiskit_ibm_runtime.fake_provider.backends import manila
+
+from qrmi.primitives.ibm import backend as ibm_backend
+from qrmi.primitives.ibm.backend import QRMIBackend, get_backend
+
+
+def _load_manila(name):
+    with open(
+        os.path.join(os.path.dirname(manila.__file__), name), encoding="utf-8"
+    ) as json_file:
+        return json.load(json_file)
+
+
+class _TaskResult:
+    def __init__(self, value):
+        """Store raw target payload."""
+        self.value = value
+
+
+class _FakeQRMI:
+    def __init__(self):
+        """Create a QRMI stub serving the FakeManila configuration and properties."""
+        self.configuration = _load_manila("conf_manila.json")
+        self.properties = _load_manila("props_manila.json")
+        self.target_calls = 0
+
+    def target(self):
+        """Return the current configuration and properties as a target payload."""
+        self.target_calls += 1
+        return _TaskResult(
+            json.dumps(
+                {"configuration": self.configuration, "properties": self.properties}
+            )
+        )
+
+    @staticmethod
+    def is_accessible():
+        """Report the resource as accessible."""
+        return True
+
+
+@pytest.fixture(autouse=True)
+def _empty_target_cache(monkeypatch):
+    monkeypatch.setattr(QRMIBackend, "_TARGET_CACHE", OrderedDict())
+
+
+def test_get_backend_shares_target_between_backends():
+    """Return a new backend per call which reuses the converted target."""
+    qrmi = _FakeQRMI()
+
+    backend = get_backend(qrmi)
+    other = get_backend(qrmi)
+
+    assert backend is not other
+    assert backend.name == "ibmq_manila"
+    assert backend.target.num_qubits == 5
+    assert other.target is backend.target
+    assert other.configuration() is backend.configuration()
+    assert qrmi.target_calls == 2
+
+
+def test_backend_skips_decoding_cached_payload(monkeypatch):
+    """Decode the target payload only the first time it is seen."""
+    qrmi = _FakeQRMI()
+    decoded = []
+    loads = ibm_backend._json.loads
+
+    def _loads(data):
+        decoded.append(data)
+        return loads(data)
+
+    monkeypatch.setattr(ibm_backend._json, "loads", _loads)
+    backend = QRMIBackend(qrmi)
+    other = QRMIBackend(qrmi)
+
+    assert len(decoded) == 1
+    assert other.name == backend.name == "ibmq_manila"
+    assert other.online_date == backend.online_date
+
+
+def test_get_backend_rebuilds_target_for_new_payload():
+    """Convert the target again when the payload content changes."""
+    qrmi = _FakeQRMI()
+    backend = get_backend(qrmi)
+
+    qrmi.configuration["backend_version"] = "9.9.9"
+    other = get_backend(qrmi)
+
+    assert other.target is not backend.target
+    assert other.backend_version == "9.9.9"
+    assert backend.backend_version == "1.2.6"
+
+
+def test_get_backend_evicts_least_recently_used_target(monkeypatch):
+    """Keep a target converted again recently when the cache overflows."""
+    monkeypatch.setattr(QRMIBackend, "_TARGET_CACHE_SIZE", 2)
+    qrmi = _FakeQRMI()
+    targets = {}
+    for version in ["1", "2", "1", "3"]:
+        qrmi.configuration["backend_version"] = version
+        targets.setdefault(version, get_backend(qrmi).target)
+
+    qrmi.configuration["backend_version"] = "1"
+    assert get_backend(qrmi).target is targets["1"]
+    qrmi.configuration["backend_version"] = "2"
+    assert get_backend(qrmi).target is not targets["2"]
+
+
+def test_get_backend_isolates_options_between_backends():
+    """Options changed on one backend do not leak into later backends."""
+    qrmi = _FakeQRMI()
+    backend = get_backend(qrmi)
+    backend.set_options(use_fractional_gates=True, shots=10)
+    backend.refresh()
+
+    other = get_backend(qrmi, use_fractional_gates=False)
+
+    assert backend.get_translation_stage_plugin() == "ibm_dynamic_and_fractional"
+    assert other.get_translation_stage_plugin() == "ibm_dynamic_circuits"
+    assert other.target is not backend.target
+    assert other.options.shots == 4000
+
+
+def test_configuration_attrs_are_promoted_per_backend():
+    """Store proxied configuration attributes on the instance until refresh."""
+    qrmi = _FakeQRMI()
+    backend = get_backend(qrmi)
+    other = get_backend(qrmi)
+
+    assert backend.conditional is False
+    assert backend.__dict__["conditional"] is False
+    assert "conditional" not in other.__dict__
+
+    qrmi.configuration["conditional"] = True
+    backend.refresh()
+
+    assert "conditional" not in backend.__dict__
+    assert backend.conditional is True
+    assert other.conditional is False
+
+
+class _Gate:
+    def __init__(self, qubits):
+        """Store gate qubits."""
+        self.qubits = qubits
+
+
+class _Properties:
+    def __init__(self, faulty_qubits=(), faulty_gates=()):
+        """Store faulty qubits and gates."""
+        self._faulty_qubits = list(faulty_qubits)
+        self._faulty_gates = [_Gate(qubits) for qubits in faulty_gates]
+
+    def faulty_qubits(self):
+        """Return faulty qubit indices."""
+        return self._faulty_qubits
+
+    def faulty_gates(self):
+        """Return faulty gates."""
+        return self._faulty_gates
+
+
+def _backend(properties):
+    backend = QRMIBackend.__new__(QRMIBackend)
+    backend._configuration_attrs = set()
+    backend._properties = properties
+    backend._faulty_qubits, backend._faulty_edges = backend._faulty_components(
+        properties
+    )
+    return backend
+
+
+def test_check_faulty_passes_on_healthy_circuit():
+    """Accept circuits which avoid faulty qubits and edges."""
+    backend = _backend(_Properties(faulty_qubits=[3], faulty_gates=[[0, 1]]))
+    circuit = QuantumCircuit(4)
+    circuit.h(0)
+    circuit.cx(0, 2)
+    circuit.cx(2, 1)
+
+    backend.check_faulty(circuit)
+
+
+def test_check_faulty_rejects_faulty_qubit():
+    """Reject circuits operating on a faulty qubit."""
+    backend = _backend(_Properties(faulty_qubits=[1]))
+    circuit = QuantumCircuit(2)
+    circuit.x(1)
+
+    with pytest.raises(ValueError, match="faulty qubit 1"):
+        backend.check_faulty(circuit)
+
+
+@pytest.mark.parametrize("qubits", [(0, 1), (1, 0)])
+def test_check_faulty_rejects_reversed_edge(qubits):
+    """Reject two-qubit gates on a faulty edge regardless of qubit order."""
+    backend = _backend(_Properties(faulty_gates=[[0, 1]]))
+    circuit = QuantumCircuit(2)
+    circuit.cx(*qubits)
+
+    with pytest.raises(ValueError, match="faulty edge"):
+        backend.check_faulty(circuit)
+
+
+def test_check_faulty_ignores_barriers():
+    """Skip barriers spanning faulty qubits."""
+    backend = _backend(_Properties(faulty_qubits=[1]))
+    circuit = QuantumCircuit(2)
+    circuit.barrier()
+
+    backend.check_faulty(circuit)
+
+
+def test_check_faulty_uses_reported_properties():
+    """Reject qubits and edges reported as non-operational by the backend."""
+    qrmi = _FakeQRMI()
+    faulty = {
+        "date": "2024-05-27T04:30:14-03:00",
+        "name": "operational",
+        "unit": "",
+        "value": 0,
+    }
+    qrmi.properties["qubits"][2].append(faulty)
+    for gate in qrmi.properties["gates"]:
+        if gate["gate"] == "cx" and gate["qubits"] == [3, 4]:
+            gate["parameters"].append(faulty)
+    backend = get_backend(qrmi)
+
+    circuit = QuantumCircuit(5)
+    circuit.cx(0, 1)
+    backend.check_faulty(circuit)
+
+    circuit = QuantumCircuit(5)
+    circuit.x(2)
+    with pytest.raises(ValueError, match="faulty qubit 2"):
+        backend.check_faulty(circuit)
+
+    circuit = QuantumCircuit(5)
+    circuit.cx(4, 3)
+    with pytest.raises(ValueError, match="faulty edge"):
+        backend.check_faulty(circuit)
@@ -233,3 +233,17 @@ def test_get_device_pasqal_local():
             return _TaskResult(json.dumps(target_return))
 
     assert get_device(_NoSpecsQRMI()) == MockDevice
+
+
+def test_extract_counts_reuses_well_formed_counter():
+    """Return the decoded counter as-is when it already holds integer counts."""
+    counter = {"00": 3, "11": 1}
+
+    assert pasqal_sampler._extract_counts({"counter": counter}) is counter
+
+
+def test_extract_counts_normalizes_counter():
+    """Coerce float counts and drop invalid entries."""
+    payload = {"counter": {"00": 3.0, "01": "bad", "11": 1}}
+
+    assert pasqal_sampler._extract_counts(payload) == {"00": 3, "11": 1}
@@ -0,0 +1,59 @@
+"""Tests for QRMI OpenQASM3 serialization."""
+
+from qiskit.circuit import QuantumCircuit
+
+from qrmi.primitives import qasm
+from qrmi.primitives.qasm import dumps_qasm3
+
+
+def _circuit():
+    circuit = QuantumCircuit(2)
+    circuit.h(0)
+    circuit.cx(0, 1)
+    circuit.measure_all()
+    return circuit
+
+
+def _count_exports(monkeypatch):
+    calls = []
+    exporter = qasm.qasm3.dumps
+
+    def counting_dumps(circuit, **kwargs):
+        calls.append(circuit)
+        return exporter(circuit, **kwargs)
+
+    monkeypatch.setattr(qasm.qasm3, "dumps", counting_dumps)
+    return calls
+
+
+def test_dumps_qasm3_exports_circuit():
+    """Serialize a circuit with the exporter options IBM Quantum APIs accept."""
+    assert dumps_qasm3(_circuit()) == qasm.qasm3.dumps(
+        _circuit(),
+        disable_constants=True,
+        allow_aliasing=True,
+        experimental=qasm.qasm3.ExperimentalFeatures.SWITCH_CASE_V1,
+    )
+
+
+def test_dumps_qasm3_memo_exports_circuit_once(monkeypatch):
+    """Serialize a circuit shared by several pubs once per memo."""
+    calls = _count_exports(monkeypatch)
+    circuit = _circuit()
+    memo = {}
+
+    assert dumps_qasm3(circuit, memo) == dumps_qasm3(circuit, memo)
+    assert calls == [circuit]
+    assert memo[id(circuit)][0] is circuit
+
+
+def test_dumps_qasm3_memo_exports_copies(monkeypatch):
+    """Serialize distinct circuit objects separately, even if equal."""
+    calls = _count_exports(monkeypatch)
+    circuit = _circuit()
+    memo = {}
+
+    dumps_qasm3(circuit, memo)
+    dumps_qasm3(circuit.copy(), memo)
+
+    assert len(calls) == 2
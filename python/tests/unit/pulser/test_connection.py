@@ -218,6 +218,28 @@ def test_submit_wait_true_returns_remote_results() -> None:
     assert remote_results.results[0].bitstring_counts == {"0": 3}
 
 
+def test_submit_wait_true_backs_off_polling(monkeypatch) -> None:
+    """Poll task status with exponentially growing, capped delays."""
+
+    class _SlowQRMI(_FakeQRMI):
+        def __init__(self):
+            """Report the task as running for a few polls."""
+            super().__init__()
+            self._statuses = [TaskStatus.Running] * 7 + [TaskStatus.Completed]
+
+        def task_status(self, _job_id):
+            """Return the next task status."""
+            return self._statuses.pop(0)
+
+    delays = []
+    monkeypatch.setattr("qrmi.pulser.connection.time.sleep", delays.append)
+    connection = PulserQRMIConnection(qrmi=_SlowQRMI())  # type: ignore[arg-type]
+
+    connection.submit(_build_sequence(), wait=True, job_params=[{"runs": 5}])
+
+    assert delays == [0.05, 0.1, 0.2, 0.4, 0.8, 1.6, 2.0]
+
+
 def test_remote_results_return_sampled_result() -> None:
     """Return sampled results from a completed QRMI task."""
     connection = PulserQRMIConnection(qrmi=_FakeQRMI())  # type: ignore[arg-type]
@@ -0,0 +1,31 @@
+"""Tests for QRMI JSON helpers."""
+
+import json
+
+from qrmi import _json
+
+
+def _compact(obj):
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def test_dumps_writes_compact_document():
+    """Serialize without whitespace between separators."""
+    assert _json.dumps({"a": [1, 2.5, None]}) == '{"a":[1,2.5,null]}'
+
+
+def test_dumps_converts_non_str_keys():
+    """Write non-string dictionary keys as strings like the json module."""
+    assert _json.dumps({1: "a", None: "b"}) == _compact({1: "a", None: "b"})
+
+
+def test_dumps_falls_back_for_unsupported_objects():
+    """Pass objects orjson cannot serialize to the json module."""
+    assert _json.dumps({"a": [2**70]}) == _compact({"a": [2**70]})
+
+
+def test_dumps_keeps_non_finite_floats():
+    """Write NaN and infinity as the json module does, not as null."""
+    obj = {"values": [float("nan"), float("inf"), None]}
+
+    assert _json.dumps(obj) == '{"values":[NaN,Infinity,null]}'